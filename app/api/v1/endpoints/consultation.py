@@ -1,13 +1,19 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Response
 from app.models.diagnosis import SymptomInput, ConsultationResponse, DiagnosisResult
 from app.services.ai_service import process_symptoms_async
-from app.core.session_storage import load_session, save_session, session_exists
+from app.core.session_storage import load_session, load_session_json, save_session
+from app.core.session_state import SessionState, encode_response
 from app.api.deps import get_current_user
 from app.models.user import User
 import uuid
 
 router = APIRouter()
 
+# 以下接口直接返回已编码的 JSON (Response)，FastAPI 不会再按 response_model 重复校验；
+# response_model 仅用于生成接口文档
+def _json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
 @router.post("/consultation/submit_symptom", response_model=ConsultationResponse)
 async def submit_symptom(
     symptom_data: SymptomInput,
@@ -20,21 +26,19 @@ async def submit_symptom(
     session_id = symptom_data.session_id
     
     # 1. 检查是“新问诊”还是“回复追问”
-    if session_id and await session_exists(session_id):
-        # --- 老会话：读取现有数据 ---
-        current_session = await load_session(session_id)
+    current_session = await load_session(session_id) if session_id else None
+    if current_session is not None:
+        # --- 老会话：沿用现有数据 ---
         # 更新状态为处理中，准备让 AI 思考
-        current_session.status = "processing"
+        current_session.set_status("processing")
         current_session.next_question = None 
     else:
         # --- 新会话：初始化 ---
         session_id = str(uuid.uuid4())
-        current_session = ConsultationResponse(
+        current_session = SessionState(
             session_id=session_id,
-            status="processing",
             progress=0,
-            next_question="正在分析您的病情...",
-            history=[] # 初始化空历史
+            next_question="正在分析您的病情..."
         )
     
     # 2. 保存当前状态（防止异步任务未启动前前端查询报错）
@@ -49,14 +53,15 @@ async def submit_symptom(
         symptom_data
     )
     
-    return current_session
+    return _json_response(encode_response(current_session))
 
 @router.get("/consultation/{session_id}/status", response_model=ConsultationResponse)
 async def get_consultation_status(session_id: str):
-    session_data = await load_session(session_id)
-    if not session_data:
+    # 轮询接口：存储的字节串直接转为对外 JSON，不构造中间对象
+    content = await load_session_json(session_id)
+    if content is None:
         raise HTTPException(status_code=404, detail="会话不存在")
-    return session_data
+    return _json_response(content)
 
 @router.get("/consultation/{session_id}/result", response_model=DiagnosisResult)
 async def get_diagnosis_result(session_id: str):
@@ -64,10 +69,11 @@ async def get_diagnosis_result(session_id: str):
     if not session_data:
         raise HTTPException(status_code=404, detail="会话不存在")
     
-    if session_data.status != "complete":
+    if session_data.status_name != "complete":
         raise HTTPException(status_code=425, detail="诊断仍在进行中")
         
     if not session_data.diagnosis_result:
         raise HTTPException(status_code=500, detail="数据丢失")
 
+    # 交给 response_model 校验一次即可
     return session_data.diagnosis_result
\ No newline at end of file
@@ -1,8 +1,9 @@
+import os
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# 定义 SQLite 数据库文件
-DATABASE_URL = "sqlite+aiosqlite:///./diagnosis_history.db"
+# 定义 SQLite 数据库文件（可通过环境变量 DATABASE_URL 覆盖）
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./diagnosis_history.db")
 
 # 创建异步数据库引擎
 # connect_args 用于 aiosqlite，确保多线程访问的安全性
@@ -0,0 +1,150 @@
+import hashlib
+import mimetypes
+import os
+from typing import Dict, Optional, Tuple
+
+from fastapi import FastAPI, Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.exceptions import HTTPException
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.staticfiles import StaticFiles
+
+# 由 scripts/build_frontend.py 生成的前端构建产物
+FRONTEND_DIST_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "frontend", "dist"
+)
+
+# 文件名带内容哈希，内容变化即换名，可以永久缓存
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 按优先级排列的预压缩格式: (Content-Encoding, 文件后缀)
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(headers: Headers):
+    """解析 Accept-Encoding，返回客户端可接受的预压缩格式；q=0 表示不可接受"""
+    qualities = {}
+    for item in headers.get("accept-encoding", "").split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    # 未单独列出的格式按 "*" 的权重处理
+    default = qualities.get("*", 0.0)
+    return [
+        (enc, suffix) for enc, suffix in PRECOMPRESSED_ENCODINGS
+        if qualities.get(enc, default) > 0
+    ]
+
+
+class QualityAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware 只按子串判断 "gzip"，会忽略 gzip;q=0；这里先按 q 值解析一次。
+    """
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            accepted = [enc for enc, _ in _accepted_encodings(Headers(scope=scope))]
+            if "gzip" not in accepted:
+                async def send_with_vary(message):
+                    if message["type"] == "http.response.start":
+                        headers = MutableHeaders(raw=message["headers"])
+                        if "accept-encoding" not in headers.get("vary", "").lower():
+                            headers.add_vary_header("Accept-Encoding")
+                    await send(message)
+
+                await self.app(scope, receive, send_with_vary)
+                return
+        await super().__call__(scope, receive, send)
+
+
+def _content_type(path: str) -> str:
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if media_type.startswith("text/"):
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    静态资源：优先返回构建时生成的 .br / .gz 文件，并附带永久缓存头。
+    """
+    async def get_response(self, path: str, scope) -> Response:
+        for encoding, suffix in _accepted_encodings(Headers(scope=scope)):
+            try:
+                response = await super().get_response(path + suffix, scope)
+            except HTTPException:
+                continue
+            response.headers["content-encoding"] = encoding
+            response.headers["content-type"] = _content_type(path)
+            # 带 Content-Encoding 的响应会被 GZipMiddleware 跳过，需要自行声明 Vary
+            response.headers["vary"] = "Accept-Encoding"
+            break
+        else:
+            response = await super().get_response(path, scope)
+
+        response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+class SpaShell:
+    """
+    SPA 入口页 index.html。启动时读入内存，按内容生成 ETag，支持 304 协商缓存。
+    """
+    def __init__(self, dist_dir: str):
+        path = os.path.join(dist_dir, "index.html")
+        with open(path, "rb") as f:
+            body = f.read()
+        digest = hashlib.sha256(body).hexdigest()[:16]
+
+        # 编码 -> (ETag, 内容)；不同编码的 ETag 不能相同
+        self.variants: Dict[Optional[str], Tuple[str, bytes]] = {None: (f'"{digest}"', body)}
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if os.path.exists(path + suffix):
+                with open(path + suffix, "rb") as f:
+                    self.variants[encoding] = (f'"{digest}-{encoding}"', f.read())
+
+    def response(self, request: Request) -> Response:
+        encoding = next(
+            (enc for enc, _ in _accepted_encodings(request.headers) if enc in self.variants),
+            None
+        )
+        etag, body = self.variants[encoding]
+        headers = {
+            "etag": etag,
+            # 每次都向服务端确认，保证发版后立即拿到新的资源地址
+            "cache-control": "no-cache",
+        }
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            headers["vary"] = "Accept-Encoding"
+            return Response(status_code=304, headers=headers)
+
+        if encoding is not None:
+            headers["content-encoding"] = encoding
+            headers["vary"] = "Accept-Encoding"
+        return Response(content=body, media_type="text/html", headers=headers)
+
+
+def mount_frontend(app: FastAPI, dist_dir: str = FRONTEND_DIST_DIR) -> Optional[SpaShell]:
+    """
+    若前端已构建，挂载 /assets 并返回入口页；未构建时返回 None。
+    """
+    if not os.path.exists(os.path.join(dist_dir, "index.html")):
+        return None
+    app.mount(
+        "/assets",
+        PrecompressedStaticFiles(directory=os.path.join(dist_dir, "assets")),
+        name="assets"
+    )
+    return SpaShell(dist_dir)
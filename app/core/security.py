@@ -1,16 +1,19 @@
-import bcrypt
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import jwt
 from app.core.config import settings
 
+# bcrypt / jose 在首次使用时再导入，避免拖慢应用启动
+
 def hash_password(password: str) -> str:
+    import bcrypt
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    import bcrypt
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -0,0 +1,160 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from app.models.diagnosis import ConsultationResponse, DiagnosisResult
+
+# 会话的内部紧凑表示：对外接口直接输出与 ConsultationResponse 同结构的 JSON，
+# 只在需要 Pydantic 模型时才通过 to_response() 转换。
+# 角色、状态使用整数编码，避免每条对话都携带一个 dict 和重复的字符串。
+
+ROLES = ("user", "assistant", "system")
+STATUSES = ("processing", "awaiting_input", "complete")
+
+_ROLE_CODES = {name: code for code, name in enumerate(ROLES)}
+_STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+
+# 编码格式版本号，修改字段布局时递增
+CODEC_VERSION = 1
+
+
+@dataclass(slots=True)
+class Turn:
+    """单条对话记录，role 为 ROLES 中的下标"""
+    role: int
+    content: str
+
+    @property
+    def role_name(self) -> str:
+        return ROLES[self.role]
+
+
+@dataclass(slots=True)
+class SessionState:
+    """进行中的问诊会话（内部使用）"""
+    session_id: str
+    status: int = _STATUS_CODES["processing"]
+    next_question: Optional[str] = None
+    progress: int = 0
+    # 诊断结果以 dict 形式保存，写入前已由 DiagnosisResult 校验
+    diagnosis_result: Optional[Dict[str, Any]] = None
+    history: List[Turn] = field(default_factory=list)
+
+    @property
+    def status_name(self) -> str:
+        return STATUSES[self.status]
+
+    def set_status(self, status: str):
+        self.status = _STATUS_CODES[status]
+
+    def add_turn(self, role: str, content: str):
+        self.history.append(Turn(_ROLE_CODES[role], content))
+
+    def history_dicts(self) -> List[Dict[str, str]]:
+        """还原为 [{"role": ..., "content": ...}] 格式，用于调用大模型和存库"""
+        return [{"role": ROLES[t.role], "content": t.content} for t in self.history]
+
+    def to_response(self) -> ConsultationResponse:
+        """转换为对外的 Pydantic 响应模型"""
+        return ConsultationResponse(
+            session_id=self.session_id,
+            status=self.status_name,
+            next_question=self.next_question,
+            progress=self.progress,
+            diagnosis_result=(
+                DiagnosisResult(**self.diagnosis_result)
+                if self.diagnosis_result is not None else None
+            ),
+            history=self.history_dicts(),
+        )
+
+    @classmethod
+    def from_response(cls, data: ConsultationResponse) -> "SessionState":
+        state = cls(
+            session_id=data.session_id,
+            status=_STATUS_CODES[data.status],
+            next_question=data.next_question,
+            progress=data.progress,
+            diagnosis_result=(
+                data.diagnosis_result.model_dump()
+                if data.diagnosis_result is not None else None
+            ),
+        )
+        for msg in data.history:
+            state.add_turn(msg["role"], msg["content"])
+        return state
+
+
+def _unpack(raw: bytes):
+    payload = orjson.loads(raw)
+    version, session_id, status, next_question, progress, diagnosis_result, turns = payload
+    if version != CODEC_VERSION:
+        raise ValueError(f"不支持的会话编码版本: {version}")
+    return session_id, status, next_question, progress, diagnosis_result, turns
+
+
+def encode_session(state: SessionState) -> bytes:
+    """
+    将会话编码为紧凑的字节串。
+    布局: [版本, session_id, 状态码, 追问, 进度, 诊断结果, [角色码, 内容, 角色码, 内容, ...]]
+    """
+    turns = []
+    for t in state.history:
+        turns.append(t.role)
+        turns.append(t.content)
+    return orjson.dumps([
+        CODEC_VERSION,
+        state.session_id,
+        state.status,
+        state.next_question,
+        state.progress,
+        state.diagnosis_result,
+        turns,
+    ])
+
+
+def decode_session(raw: bytes) -> SessionState:
+    """encode_session 的逆操作"""
+    session_id, status, next_question, progress, diagnosis_result, turns = _unpack(raw)
+    history = [Turn(turns[i], turns[i + 1]) for i in range(0, len(turns), 2)]
+    return SessionState(
+        session_id=session_id,
+        status=status,
+        next_question=next_question,
+        progress=progress,
+        diagnosis_result=diagnosis_result,
+        history=history,
+    )
+
+
+# --- 对外 JSON ---
+# 以下函数直接生成与 ConsultationResponse 结构一致的 JSON 字节串，
+# 接口返回 Response 时 FastAPI 不会再按 response_model 重复校验。
+# diagnosis_result 写入会话前已经过 DiagnosisResult 校验。
+
+def encode_response(state: SessionState) -> bytes:
+    return orjson.dumps({
+        "session_id": state.session_id,
+        "status": state.status_name,
+        "next_question": state.next_question,
+        "progress": state.progress,
+        "diagnosis_result": state.diagnosis_result,
+        "history": state.history_dicts(),
+    })
+
+
+def transcode_response(raw: bytes) -> bytes:
+    """将存储的字节串直接转为对外 JSON，不构造 SessionState（用于状态轮询）"""
+    session_id, status, next_question, progress, diagnosis_result, turns = _unpack(raw)
+    return orjson.dumps({
+        "session_id": session_id,
+        "status": STATUSES[status],
+        "next_question": next_question,
+        "progress": progress,
+        "diagnosis_result": diagnosis_result,
+        "history": [
+            {"role": ROLES[turns[i]], "content": turns[i + 1]}
+            for i in range(0, len(turns), 2)
+        ],
+    })
@@ -1,27 +1,36 @@
-from app.models.diagnosis import ConsultationResponse
+from app.core.session_state import SessionState, encode_session, decode_session, transcode_response
 # 导入内存字典，用于存储会话状态
 from app.core.session import session_store
-import json
 
 # 由于切换到内存字典，这个常量不再需要但保留在这里
-# SESSION_EXPIRATION_SECONDS = 60 * 60 * 24 
+# SESSION_EXPIRATION_SECONDS = 60 * 60 * 24
 
-async def save_session(session_id: str, data: ConsultationResponse):
+async def save_session(session_id: str, data: SessionState):
     """
-    将问诊会话数据存入内存字典 (替代 Redis)。
+    将问诊会话数据编码后存入内存字典 (替代 Redis)。
     """
-    # 直接存储 Pydantic 对象
-    session_store[session_id] = data
+    # 存储紧凑字节串，与切换回 Redis 时的存储格式保持一致
+    session_store[session_id] = encode_session(data)
 
-async def load_session(session_id: str) -> ConsultationResponse | None:
+def _decode(session_id: str, decoder):
+    raw = session_store.get(session_id)
+    if raw is None:
+        return None
+    try:
+        return decoder(raw)
+    except (ValueError, TypeError, IndexError) as e:
+        # 数据损坏或编码版本不匹配时按会话不存在处理
+        print(f"会话解码失败 {session_id}: {e}")
+        return None
+
+async def load_session(session_id: str) -> SessionState | None:
     """
     从内存字典读取会话数据。
     """
-    # 从字典中获取数据
-    return session_store.get(session_id)
+    return _decode(session_id, decode_session)
 
-async def session_exists(session_id: str) -> bool:
+async def load_session_json(session_id: str) -> bytes | None:
     """
-    检查会话是否存在于内存字典中。
+    读取会话并直接返回对外 JSON，供状态轮询使用。
     """
-    return session_id in session_store
\ No newline at end of file
+    return _decode(session_id, transcode_response)
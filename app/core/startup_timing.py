@@ -0,0 +1,24 @@
+import time
+from typing import Dict
+
+# 记录应用启动各阶段耗时（毫秒），便于观察自动扩容时 worker 的就绪速度。
+# 该模块需要在 app.main 中最先导入，导入时刻即为计时起点。
+
+_start = time.perf_counter()
+_last = _start
+
+timings: Dict[str, float] = {}
+
+def mark(phase: str):
+    """记录从上一阶段结束到现在的耗时"""
+    global _last
+    now = time.perf_counter()
+    timings[phase] = round((now - _last) * 1000, 2)
+    _last = now
+
+def total_ms() -> float:
+    return round((_last - _start) * 1000, 2)
+
+def report():
+    phases = ", ".join(f"{name}={ms}ms" for name, ms in timings.items())
+    print(f"启动耗时: {phases}, total={total_ms()}ms")
@@ -1,16 +1,21 @@
-from fastapi import FastAPI
+from app.core import startup_timing # 最先导入，作为启动计时起点
+from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
+startup_timing.mark("import_fastapi")
 from app.api.v1.api import api_router
-from app.core.database import engine, Base
-from app.models.history import DiagnosisHistory # 确保模型被加载
+from app.core.frontend import mount_frontend, QualityAwareGZipMiddleware
+startup_timing.mark("import_app")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 应用启动时执行
-    async with engine.begin() as conn:
-        # 这将根据加载的所有模型创建表 (这里是 DiagnosisHistory)
-        await conn.run_sync(Base.metadata.create_all)
+    # 启动时不再执行任何 DDL：表结构由 Alembic 迁移管理，
+    # 部署时在启动 worker 之前单独运行一次 `alembic upgrade head`
+    # 该阶段是模块导入结束到 lifespan 开始之间的耗时（服务器自身的启动开销）
+    startup_timing.mark("server_to_lifespan")
+    app.state.startup_timings = dict(startup_timing.timings)
+    startup_timing.report()
     yield
     # 应用关闭时执行 (如果需要)
     # await engine.dispose()
@@ -30,8 +35,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 压缩 JSON 等动态响应；已带 Content-Encoding 的预压缩静态文件会被跳过
+app.add_middleware(QualityAwareGZipMiddleware, minimum_size=1000)
+
 app.include_router(api_router, prefix="/api/v1")
 
+# 前端已构建 (python scripts/build_frontend.py) 时，由后端直接提供页面
+spa_shell = mount_frontend(app)
+startup_timing.mark("create_app")
+
 @app.get("/")
-def read_root():
-    return {"message": "AI Diagnosis Backend Running"}
\ No newline at end of file
+def read_root(request: Request):
+    if spa_shell is not None:
+        return spa_shell.response(request)
+    return {"message": "AI Diagnosis Backend Running"}
+
+@app.get("/health")
+def health(request: Request):
+    """
+    就绪探针：lifespan 执行后即可就绪，同时返回启动各阶段耗时（毫秒），便于观察扩容时的冷启动。
+    """
+    return {"status": "ok", "startup_timings": request.app.state.startup_timings}
\ No newline at end of file
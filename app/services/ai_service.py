@@ -1,14 +1,14 @@
-import httpx
 import json
 import re
 import os
-from openai import AsyncOpenAI
 from app.models.diagnosis import SymptomInput, ConsultationResponse, DiagnosisResult
 from app.core.session_storage import save_session, load_session
 from app.core.database import AsyncSessionFactory
 from app.crud.history_crud import create_diagnosis_history
 from app.core.config import settings
 
+# 注意：httpx / openai 体积较大，统一在首次调用时再导入，缩短 worker 冷启动时间
+
 # --- 工具函数 ---
 def clean_json_string(json_str: str) -> str:
     pattern = r"```json\s*(.*?)\s*```"
@@ -20,6 +20,7 @@ def clean_json_string(json_str: str) -> str:
     return json_str
 
 async def download_file(url: str) -> bytes:
+    import httpx
     async with httpx.AsyncClient(timeout=30.0) as client:
         resp = await client.get(url)
         resp.raise_for_status()
@@ -29,6 +30,7 @@ async def download_file(url: str) -> bytes:
 async def process_voice_input(audio_url: str) -> str:
     """真实语音识别逻辑"""
     print(f"处理语音: {audio_url}")
+    from openai import AsyncOpenAI
     api_key = os.getenv("MULTI_MODAL_API_KEY", settings.DEEPSEEK_API_KEY)
     base_url = os.getenv("MULTI_MODAL_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1")
     client = AsyncOpenAI(api_key=api_key, base_url=base_url)
@@ -46,6 +48,7 @@ async def process_voice_input(audio_url: str) -> str:
 async def process_image_input(image_url: str) -> str:
     """真实图片识别逻辑"""
     print(f"处理图片: {image_url}")
+    from openai import AsyncOpenAI
     api_key = os.getenv("MULTI_MODAL_API_KEY", settings.DEEPSEEK_API_KEY)
     base_url = os.getenv("MULTI_MODAL_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1")
     client = AsyncOpenAI(api_key=api_key, base_url=base_url)
@@ -68,11 +71,11 @@ async def process_image_input(image_url: str) -> str:
 # --- 核心主流程 (支持多轮对话) ---
 
 async def process_symptoms_async(session_id: str, user_id: int, data: SymptomInput):
-    try:
-        # 1. 加载当前会话
-        session = await load_session(session_id)
-        if not session: return
+    # 1. 加载当前会话（放在 try 之外，保证下方异常处理时 session 一定存在）
+    session = await load_session(session_id)
+    if not session: return
 
+    try:
         # 2. 解析本次输入
         current_text = ""
         if data.input_type == "text":
@@ -83,7 +86,7 @@ async def process_symptoms_async(session_id: str, user_id: int, data: SymptomInp
             current_text = await process_image_input(data.content)
 
         # 3. 将新输入追加到历史记录 (User Role)
-        session.history.append({"role": "user", "content": current_text})
+        session.add_turn("user", current_text)
         
         # 4. 构造 AI 提示词 (Prompt)
         # 关键：要求 AI 判断是追问 (question) 还是诊断 (diagnosis)
@@ -121,9 +124,7 @@ async def process_symptoms_async(session_id: str, user_id: int, data: SymptomInp
         # 构造发给 DeepSeek 的完整消息链
         messages = [{"role": "system", "content": system_prompt}]
         # 追加所有历史对话
-        for msg in session.history:
-            # 过滤掉 DeepSeek 不认识的字段，只留 role 和 content
-            messages.append({"role": msg["role"], "content": msg["content"]})
+        messages.extend(session.history_dicts())
 
         # 5. 调用 DeepSeek API
         headers = {
@@ -137,6 +138,7 @@ async def process_symptoms_async(session_id: str, user_id: int, data: SymptomInp
             "stream": False
         }
 
+        import httpx
         async with httpx.AsyncClient(timeout=60.0) as client:
             resp = await client.post(settings.DEEPSEEK_API_URL, headers=headers, json=payload)
             resp.raise_for_status()
@@ -150,26 +152,26 @@ async def process_symptoms_async(session_id: str, user_id: int, data: SymptomInp
             # --- 分支 A：AI 决定追问 ---
             question_text = parsed_res["content"]
             
-            session.status = "awaiting_input" # 状态变为等待用户输入
+            session.set_status("awaiting_input") # 状态变为等待用户输入
             session.next_question = question_text
             session.progress = min(session.progress + 15, 90) # 进度条增加
             
             # 将 AI 的问题加入历史
-            session.history.append({"role": "assistant", "content": question_text})
+            session.add_turn("assistant", question_text)
             
         elif parsed_res.get("type") == "diagnosis":
             # --- 分支 B：AI 决定出结果 ---
             diag_data = parsed_res["result"]
             final_diagnosis = DiagnosisResult(**diag_data)
             
-            session.status = "complete"
+            session.set_status("complete")
             session.progress = 100
-            session.diagnosis_result = final_diagnosis
+            session.diagnosis_result = final_diagnosis.model_dump()
             session.next_question = None
             
             # 将诊断摘要加入历史 (这一步很重要，让历史记录里包含 AI 最后的结论)
             # 但不要把巨大的 JSON 放这里，只放简短文本，JSON 单独存
-            session.history.append({"role": "assistant", "content": "诊断已完成，请查看下方的详细报告。"})
+            session.add_turn("assistant", "诊断已完成，请查看下方的详细报告。")
             
             # 存入数据库
             if final_diagnosis.risk_level != "unknown":
@@ -179,16 +181,16 @@ async def process_symptoms_async(session_id: str, user_id: int, data: SymptomInp
                         user_id=user_id,
                         session_id=session_id,
                         result=final_diagnosis,
-                        history=session.history # <--- 关键修改：传入完整历史
+                        history=session.history_dicts() # <--- 关键修改：传入完整历史
                     )
 
     except Exception as e:
         print(f"AI Process Error: {e}")
-        session.status = "awaiting_input"
+        session.set_status("awaiting_input")
         # 遇到错误时，让用户重试，而不是卡死
         err_msg = "抱歉，刚才连接不稳定，请您重新描述一下症状。"
         session.next_question = err_msg
-        session.history.append({"role": "assistant", "content": err_msg})
+        session.add_turn("assistant", err_msg)
 
     # 7. 保存更新后的会话数据到 Redis/内存
     await save_session(session_id, session)
\ No newline at end of file
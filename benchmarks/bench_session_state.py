@@ -0,0 +1,159 @@
+"""
+会话表示方式的基准测试：对比旧实现（内存中保存 Pydantic ConsultationResponse）与紧凑的 SessionState。
+
+- 内存占用：每个进行中会话常驻内存的字节数
+- 状态轮询：完整走一遍 FastAPI 路由（ASGI 调用，不含网络），对比
+  旧实现（字典取出 Pydantic 对象 -> response_model 校验 -> JSON 序列化）与
+  新实现（取出字节串 -> 直接转码为对外 JSON）
+- 保存 / 读取：提交症状和 AI 后台任务中存取会话的开销（旧实现直接存取对象，新实现需要编解码）
+
+运行方式（项目根目录下）:
+    python -m benchmarks.bench_session_state --sessions 2000 --turns 8
+"""
+import argparse
+import asyncio
+import gc
+import time
+import timeit
+import tracemalloc
+
+from fastapi import FastAPI, HTTPException
+
+from app.api.v1.endpoints import consultation
+from app.core.session import session_store
+from app.core.session_state import SessionState, encode_session, decode_session
+from app.models.diagnosis import ConsultationResponse
+
+USER_TEXT = "我最近两天头痛，还伴有低烧，晚上睡不好，偶尔咳嗽。"
+ASSISTANT_TEXT = "请问您的体温最高到多少度？是否有鼻塞、咽痛等其他症状？"
+
+
+def build_response(session_id: str, turns: int) -> ConsultationResponse:
+    history = []
+    for i in range(turns):
+        role = "user" if i % 2 == 0 else "assistant"
+        # 每条内容都是新的字符串对象，模拟真实请求里各自解析出来的文本
+        text = (USER_TEXT if role == "user" else ASSISTANT_TEXT) + str(i)
+        history.append({"role": role, "content": text})
+    return ConsultationResponse(
+        session_id=session_id,
+        status="awaiting_input",
+        next_question=ASSISTANT_TEXT,
+        progress=45,
+        history=history,
+    )
+
+
+def measure_memory(factory, count: int) -> float:
+    """返回每个会话平均占用的字节数"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = {f"s{i}": factory(i) for i in range(count)}
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del store
+    return (after - before) / count
+
+
+def build_app(old_store: dict) -> FastAPI:
+    """新实现使用真实的 consultation 路由；旧实现按原代码写法挂在 /old 下"""
+    app = FastAPI()
+    app.include_router(consultation.router)
+
+    @app.get("/old/{session_id}/status", response_model=ConsultationResponse)
+    async def old_status(session_id: str):
+        session_data = old_store.get(session_id)
+        if not session_data:
+            raise HTTPException(status_code=404, detail="会话不存在")
+        return session_data
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    """以最小开销直接调用 ASGI 应用，返回响应体"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def measure_poll(app: FastAPI, path: str, number: int) -> float:
+    """返回单次轮询的平均耗时 (us)"""
+    await call(app, path)
+    start = time.perf_counter()
+    for _ in range(number):
+        await call(app, path)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=2000, help="同时在内存中的会话数")
+    parser.add_argument("--turns", type=int, default=8, help="每个会话的对话轮数")
+    parser.add_argument("--number", type=int, default=5000, help="计时的循环次数")
+    args = parser.parse_args()
+
+    def pydantic_obj(i):
+        return build_response(f"session-{i}", args.turns)
+
+    def compact_bytes(i):
+        return encode_session(SessionState.from_response(build_response(f"session-{i}", args.turns)))
+
+    print(f"会话数={args.sessions} 轮数={args.turns}")
+    print("\n[内存占用 / 每会话]")
+    print(f"  旧: Pydantic 对象       {measure_memory(pydantic_obj, args.sessions):10.0f} B")
+    print(f"  新: SessionState 编码后 {measure_memory(compact_bytes, args.sessions):10.0f} B")
+
+    response = build_response("session-bench", args.turns)
+    state = SessionState.from_response(response)
+    old_store = {"session-bench": response}
+    session_store["session-bench"] = encode_session(state)
+    app = build_app(old_store)
+
+    old_body = asyncio.run(call(app, "/old/session-bench/status"))
+    new_body = asyncio.run(call(app, "/consultation/session-bench/status"))
+    assert ConsultationResponse.model_validate_json(old_body) == ConsultationResponse.model_validate_json(new_body)
+
+    old_poll = asyncio.run(measure_poll(app, "/old/session-bench/status", args.number))
+    new_poll = asyncio.run(measure_poll(app, "/consultation/session-bench/status", args.number))
+    print("\n[状态轮询 / 每次请求，含路由]")
+    print(f"  旧: 取对象 + response_model 校验序列化 {old_poll:8.2f} us")
+    print(f"  新: 取字节串 + 直接转码              {new_poll:8.2f} us")
+
+    # 提交症状与 AI 后台任务中的读写路径：旧实现直接存取对象，新实现需要编解码
+    bench_store = {}
+
+    def per_call(fn) -> float:
+        return timeit.timeit(fn, number=args.number) / args.number * 1e6
+
+    old_save = per_call(lambda: bench_store.__setitem__("session-bench", response))
+    new_save = per_call(lambda: bench_store.__setitem__("session-bench", encode_session(state)))
+    old_load = per_call(lambda: old_store.get("session-bench"))
+    new_load = per_call(lambda: decode_session(session_store.get("session-bench")))
+    print("\n[保存会话 / 每次]")
+    print(f"  旧: 字典存对象                        {old_save:8.2f} us")
+    print(f"  新: encode_session + 字典存字节串     {new_save:8.2f} us")
+    print("\n[读取会话 / 每次]")
+    print(f"  旧: 字典取对象                        {old_load:8.2f} us")
+    print(f"  新: 字典取字节串 + decode_session     {new_load:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""initial schema: users, diagnosis_history
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+已有旧版本 create_all 生成的数据库时，执行 `alembic stamp 0001` 标记即可，无需重建。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("phone_number", sa.String(), nullable=True),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_id", "users", ["id"], unique=False)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "diagnosis_history",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("possible_causes", sa.JSON(), nullable=False),
+        sa.Column("risk_level", sa.String(), nullable=False),
+        sa.Column("advice", sa.String(), nullable=False),
+        sa.Column("dialogue_history", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_diagnosis_history_id", "diagnosis_history", ["id"], unique=False)
+    op.create_index("ix_diagnosis_history_user_id", "diagnosis_history", ["user_id"], unique=False)
+    op.create_index("ix_diagnosis_history_session_id", "diagnosis_history", ["session_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_diagnosis_history_session_id", table_name="diagnosis_history")
+    op.drop_index("ix_diagnosis_history_user_id", table_name="diagnosis_history")
+    op.drop_index("ix_diagnosis_history_id", table_name="diagnosis_history")
+    op.drop_table("diagnosis_history")
+
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_table("users")
@@ -0,0 +1,262 @@
+"""
+前端构建脚本：把 index.html 依赖的 CDN 资源本地化，生成可由后端直接提供的静态文件。
+
+- 按固定版本下载 Vue / Axios / Marked / FontAwesome 到 frontend/vendor/（下载缓存，
+  按完整 URL 区分，内网环境可预先拷贝该目录后离线构建）
+- 使用 Tailwind 独立 CLI 扫描 index.html 生成静态 CSS，替换浏览器端实时编译的 Play CDN；
+  也可通过环境变量 TAILWIND_CLI 指定本地已有的 CLI 可执行文件
+- 校验每个文件的 sha256：所有下载地址都必须在 frontend/vendor.lock.json 中有记录，
+  缺少记录或不一致时直接终止构建（不会下载或执行未校验的文件）
+- 输出到 frontend/dist/：文件名带内容哈希（assets/<名称>.<哈希>.<扩展名>），
+  文本资源预压缩为 .gz 和 .br（需安装 brotli，未安装时只生成 .gz）
+- 改写 index.html 中的 CDN 地址为本地 /assets/ 路径，并注入同源接口地址 (<meta name="api-base">)
+
+运行方式（项目根目录下）:
+    python scripts/build_frontend.py
+    # 修改固定版本后，在可联网环境更新 sha256 记录（含所有平台的 Tailwind CLI），并提交 lock 文件
+    python scripts/build_frontend.py --update-lock
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+try:
+    import brotli
+except ImportError:  # brotli 为可选依赖
+    brotli = None
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_HTML = ROOT / "index.html"
+VENDOR_DIR = ROOT / "frontend" / "vendor"
+LOCK_FILE = ROOT / "frontend" / "vendor.lock.json"
+DIST_DIR = ROOT / "frontend" / "dist"
+ASSETS_URL = "/assets/"
+# 由后端提供页面时，前端使用同源的接口地址
+API_BASE = "/api/v1"
+
+# (index.html 中的原始地址, 固定版本的下载地址)
+VENDOR_ASSETS = [
+    ("https://unpkg.com/vue@3/dist/vue.global.js",
+     "https://unpkg.com/vue@3.5.13/dist/vue.global.prod.js"),
+    ("https://unpkg.com/axios/dist/axios.min.js",
+     "https://unpkg.com/axios@1.7.9/dist/axios.min.js"),
+    ("https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css",
+     "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"),
+    ("https://cdn.jsdelivr.net/npm/marked/marked.min.js",
+     "https://cdn.jsdelivr.net/npm/marked@15.0.6/marked.min.js"),
+]
+
+# Tailwind 在构建时编译为静态 CSS，替换 index.html 中的 Play CDN 脚本
+TAILWIND_VERSION = "3.4.16"
+TAILWIND_CDN_TAG = '<script src="https://cdn.tailwindcss.com"></script>'
+TAILWIND_INPUT = "@tailwind base;\n@tailwind components;\n@tailwind utilities;\n"
+# (sys.platform, 归一化后的 CPU 架构) -> 发布文件名；lock 文件记录全部平台，避免不同开发者互相覆盖
+TAILWIND_CLI_ASSETS = {
+    ("linux", "x64"): "tailwindcss-linux-x64",
+    ("linux", "arm64"): "tailwindcss-linux-arm64",
+    ("darwin", "x64"): "tailwindcss-macos-x64",
+    ("darwin", "arm64"): "tailwindcss-macos-arm64",
+    ("win32", "x64"): "tailwindcss-windows-x64.exe",
+}
+
+# 只对文本资源做预压缩，字体等已压缩格式直接输出
+COMPRESSIBLE_SUFFIXES = {".js", ".css", ".html", ".svg", ".json", ".txt", ".ttf"}
+
+CSS_URL_PATTERN = re.compile(r"url\((['\"]?)([^)'\"]+)\1\)")
+
+
+def cache_name(url: str) -> str:
+    """下载缓存中的文件名；URL 的 #fragment 可用于指定文件名"""
+    parsed = urlparse(url)
+    return parsed.fragment or Path(parsed.path).name
+
+
+def cache_path(url: str) -> Path:
+    """缓存文件以 URL 哈希为前缀，修改固定版本后不会误用旧文件"""
+    download_url = url.split("#", 1)[0]
+    key = hashlib.sha256(download_url.encode("utf-8")).hexdigest()[:12]
+    return VENDOR_DIR / f"{key}-{cache_name(url)}"
+
+
+def tailwind_cli_url(asset: str) -> str:
+    return f"https://github.com/tailwindlabs/tailwindcss/releases/download/v{TAILWIND_VERSION}/{asset}"
+
+
+class VendorLock:
+    """
+    frontend/vendor.lock.json 中固定的 sha256。
+    默认只接受已有记录的地址；update=True 时为新地址补充记录，保存时只清理本脚本已不再引用的地址。
+    """
+    def __init__(self, update: bool = False):
+        self.update = update
+        self.hashes = json.loads(LOCK_FILE.read_text(encoding="utf-8")) if LOCK_FILE.exists() else {}
+        self.known = set()
+
+    def fetch(self, url: str) -> bytes:
+        """优先读取 frontend/vendor/ 中的缓存，没有时再下载；返回前校验 sha256"""
+        download_url = url.split("#", 1)[0]
+        self.known.add(download_url)
+        expected = self.hashes.get(download_url)
+        if expected is None and not self.update:
+            sys.exit(
+                f"{LOCK_FILE.name} 中没有 {download_url} 的 sha256 记录。\n"
+                f"请在可联网环境运行 python scripts/build_frontend.py --update-lock 并提交 {LOCK_FILE.name}"
+            )
+
+        cached = cache_path(url)
+        if cached.exists():
+            data = cached.read_bytes()
+        else:
+            print(f"下载: {download_url}")
+            request = urllib.request.Request(download_url, headers={"User-Agent": "ai-doctor-build"})
+            with urllib.request.urlopen(request, timeout=60) as resp:
+                data = resp.read()
+
+        digest = hashlib.sha256(data).hexdigest()
+        if expected is None:
+            print(f"记录 sha256: {download_url}")
+            self.hashes[download_url] = digest
+        elif digest != expected:
+            sys.exit(
+                f"sha256 校验失败: {download_url}\n  期望 {expected}\n  实际 {digest}\n"
+                f"  缓存文件: {cached}"
+            )
+
+        if not cached.exists():
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            cached.write_bytes(data)
+        return data
+
+    def save(self):
+        hashes = {url: digest for url, digest in self.hashes.items() if url in self.known}
+        LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        LOCK_FILE.write_text(json.dumps(hashes, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"已更新 {LOCK_FILE.name}，请随代码一起提交")
+
+
+def write_file(path: Path, data: bytes):
+    """写出文件，并为文本资源生成 .gz / .br 预压缩版本"""
+    path.write_bytes(data)
+    if path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return
+    variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(data, quality=11)))
+    for suffix, compressed in variants:
+        # 压缩后反而更大时不输出，由服务端回退到原文件
+        if len(compressed) < len(data):
+            path.with_name(path.name + suffix).write_bytes(compressed)
+
+
+def emit_asset(name: str, data: bytes) -> str:
+    """以内容哈希命名输出资源，返回其访问 URL"""
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    stem, dot, ext = name.rpartition(".")
+    hashed = f"{stem}.{digest}.{ext}" if dot else f"{name}.{digest}"
+    write_file(DIST_DIR / "assets" / hashed, data)
+    return ASSETS_URL + hashed
+
+
+def tailwind_cli(lock: VendorLock) -> str:
+    """返回 Tailwind 独立 CLI 的路径，必要时按当前平台下载固定版本（经 sha256 校验后才会执行）"""
+    if lock.update:
+        # 更新 lock 时记录所有平台的 CLI
+        for asset in TAILWIND_CLI_ASSETS.values():
+            lock.fetch(tailwind_cli_url(asset))
+    if os.environ.get("TAILWIND_CLI"):
+        return os.environ["TAILWIND_CLI"]
+    machine = {"x86_64": "x64", "amd64": "x64", "arm64": "arm64", "aarch64": "arm64"}.get(
+        platform.machine().lower()
+    )
+    asset = TAILWIND_CLI_ASSETS.get((sys.platform, machine))
+    if asset is None:
+        sys.exit(f"不支持的平台 {sys.platform}/{platform.machine()}，请通过 TAILWIND_CLI 指定 CLI")
+    url = tailwind_cli_url(asset)
+    lock.fetch(url)
+    path = cache_path(url)
+    path.chmod(0o755)
+    return str(path)
+
+
+def build_tailwind_css(cli: str) -> bytes:
+    """扫描 index.html 中用到的类名，生成压缩后的静态 CSS"""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "input.css"
+        output = Path(tmp) / "tailwind.css"
+        source.write_text(TAILWIND_INPUT, encoding="utf-8")
+        subprocess.run(
+            [cli, "-i", str(source), "-o", str(output), "--content", str(SOURCE_HTML), "--minify"],
+            check=True,
+        )
+        return output.read_bytes()
+
+
+def rewrite_css(css_url: str, css: bytes, lock: VendorLock) -> bytes:
+    """本地化 CSS 中引用的字体等资源"""
+    text = css.decode("utf-8")
+    emitted = {}
+
+    def replace(match):
+        ref = match.group(2)
+        if ref.startswith("data:"):
+            return match.group(0)
+        url = urljoin(css_url, ref)
+        if url not in emitted:
+            emitted[url] = emit_asset(cache_name(url), lock.fetch(url))
+        return f"url({emitted[url]})"
+
+    return CSS_URL_PATTERN.sub(replace, text).encode("utf-8")
+
+
+def build(update_lock: bool = False):
+    if DIST_DIR.exists():
+        shutil.rmtree(DIST_DIR)
+    (DIST_DIR / "assets").mkdir(parents=True)
+
+    lock = VendorLock(update=update_lock)
+
+    html = SOURCE_HTML.read_text(encoding="utf-8")
+    if TAILWIND_CDN_TAG not in html:
+        sys.exit("index.html 中找不到 Tailwind Play CDN 脚本，请同步更新 TAILWIND_CDN_TAG")
+    tailwind_url = emit_asset("tailwind.css", build_tailwind_css(tailwind_cli(lock)))
+    html = html.replace(TAILWIND_CDN_TAG, f'<link href="{tailwind_url}" rel="stylesheet">')
+
+    for source_url, pinned_url in VENDOR_ASSETS:
+        if source_url + '"' not in html:
+            sys.exit(f"index.html 中找不到 {source_url}，请同步更新 VENDOR_ASSETS")
+        data = lock.fetch(pinned_url)
+        name = cache_name(pinned_url)
+        if name.endswith(".css"):
+            data = rewrite_css(pinned_url, data, lock)
+        html = html.replace(source_url + '"', emit_asset(name, data) + '"')
+
+    if "<head>" not in html:
+        sys.exit("index.html 中找不到 <head>，无法注入接口地址")
+    html = html.replace("<head>", f'<head>\n    <meta name="api-base" content="{API_BASE}">', 1)
+
+    write_file(DIST_DIR / "index.html", html.encode("utf-8"))
+    if update_lock:
+        lock.save()
+    if brotli is None:
+        print("未安装 brotli，仅生成 gzip 预压缩文件")
+    print(f"构建完成: {DIST_DIR}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="构建由后端提供的前端静态文件")
+    parser.add_argument(
+        "--update-lock", action="store_true",
+        help="为新的下载地址记录 sha256 并写回 frontend/vendor.lock.json",
+    )
+    build(update_lock=parser.parse_args().update_lock)
@@ -0,0 +1,125 @@
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from app.core.frontend import (
+    IMMUTABLE_CACHE_CONTROL, QualityAwareGZipMiddleware, _accepted_encodings, mount_frontend
+)
+
+
+def encodings(accept: str):
+    return [enc for enc, _ in _accepted_encodings(Headers({"accept-encoding": accept}))]
+
+
+def test_accepted_encodings_prefers_brotli():
+    assert encodings("gzip, deflate, br") == ["br", "gzip"]
+
+
+def test_accepted_encodings_respects_q_zero():
+    assert encodings("gzip;q=0, br;q=0") == []
+    assert encodings("br;q=0, gzip;q=0.5") == ["gzip"]
+
+
+def test_accepted_encodings_wildcard():
+    assert encodings("*") == ["br", "gzip"]
+    assert encodings("*;q=0.5, br;q=0") == ["gzip"]
+    assert encodings("") == []
+
+
+# --- 基于临时构建目录的端到端测试 ---
+HTML = b"<!DOCTYPE html><html><head></head><body>" + b"<p>shell</p>" * 200 + b"</body></html>"
+JS = b"var x = 1;\n" * 300
+WOFF2 = b"\x00woff2" * 300
+
+
+def write_variants(path, data):
+    path.write_bytes(data)
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(data))
+    path.with_name(path.name + ".br").write_bytes(brotli.compress(data))
+
+
+@pytest.fixture
+def client(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    write_variants(tmp_path / "index.html", HTML)
+    write_variants(assets / "app.abc123.js", JS)
+    (assets / "font.abc123.woff2").write_bytes(WOFF2)
+
+    app = FastAPI()
+    app.add_middleware(QualityAwareGZipMiddleware, minimum_size=1000)
+    shell = mount_frontend(app, str(tmp_path))
+
+    @app.get("/")
+    def read_root(request: Request):
+        return shell.response(request)
+
+    @app.get("/api/data")
+    def data():
+        return {"items": ["症状"] * 500}
+
+    return TestClient(app)
+
+
+def get(client, path, accept, **headers):
+    return client.get(path, headers={"accept-encoding": accept, **headers})
+
+
+def test_shell_etag_per_encoding(client):
+    etags = {}
+    for accept, encoding in (("br", "br"), ("gzip", "gzip"), ("identity", None)):
+        resp = get(client, "/", accept)
+        assert resp.status_code == 200
+        assert resp.content == HTML
+        assert resp.headers.get("content-encoding") == encoding
+        assert resp.headers["cache-control"] == "no-cache"
+        assert "accept-encoding" in resp.headers["vary"].lower()
+        etags[encoding] = resp.headers["etag"]
+    assert len(set(etags.values())) == 3
+
+
+def test_shell_not_modified(client):
+    etag = get(client, "/", "br").headers["etag"]
+    resp = get(client, "/", "br", **{"if-none-match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert resp.headers["cache-control"] == "no-cache"
+    assert "accept-encoding" in resp.headers["vary"].lower()
+
+    # 另一种编码的 ETag 不能命中
+    assert get(client, "/", "gzip", **{"if-none-match": etag}).status_code == 200
+
+
+def test_static_prefers_brotli(client):
+    resp = get(client, "/assets/app.abc123.js", "gzip, br")
+    assert resp.headers["content-encoding"] == "br"
+    assert resp.headers["content-type"] == "text/javascript; charset=utf-8"
+    assert resp.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert resp.content == JS
+
+    resp = get(client, "/assets/app.abc123.js", "gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.content == JS
+
+
+def test_static_falls_back_to_plain_file(client):
+    resp = get(client, "/assets/font.abc123.woff2", "br")
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["content-type"] == "font/woff2"
+    assert resp.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert resp.content == WOFF2
+
+
+def test_gzip_middleware_respects_q_zero(client):
+    assert get(client, "/api/data", "gzip").headers["content-encoding"] == "gzip"
+
+    for path in ("/api/data", "/", "/assets/app.abc123.js"):
+        resp = get(client, path, "gzip;q=0, br;q=0")
+        assert "content-encoding" not in resp.headers, path
+        assert "accept-encoding" in resp.headers["vary"].lower(), path
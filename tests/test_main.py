@@ -0,0 +1,40 @@
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BOOT_SCRIPT = """
+from fastapi.testclient import TestClient
+from app.main import app
+
+with TestClient(app) as client:
+    assert client.get("/health").status_code == 200
+"""
+
+
+def test_boot_runs_no_ddl(tmp_path):
+    # 在独立进程中指向一个空的 SQLite 库启动应用，表结构只能由 Alembic 迁移创建
+    db_file = tmp_path / "boot.db"
+    sqlite3.connect(db_file).close()
+    env = dict(os.environ, DATABASE_URL=f"sqlite+aiosqlite:///{db_file}")
+    subprocess.run([sys.executable, "-c", BOOT_SCRIPT], cwd=ROOT, env=env, check=True)
+
+    with sqlite3.connect(db_file) as conn:
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    assert tables == []
+
+
+def test_health_reports_startup_timings():
+    from app.main import app
+
+    with TestClient(app) as client:
+        resp = client.get("/health")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == "ok"
+    assert {"import_app", "create_app", "server_to_lifespan"} <= body["startup_timings"].keys()
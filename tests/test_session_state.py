@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from app.core import session_state
+from app.core.session_state import (
+    SessionState, encode_session, decode_session, encode_response, transcode_response
+)
+
+
+def make_state() -> SessionState:
+    state = SessionState(session_id="s1", progress=30, next_question="发烧几天了？")
+    state.add_turn("user", "我头痛")
+    state.add_turn("assistant", "发烧几天了？")
+    state.set_status("awaiting_input")
+    state.diagnosis_result = {
+        "possible_causes": [{"name": "感冒", "confidence": "80%"}],
+        "risk_level": "low",
+        "advice": "多喝水",
+    }
+    return state
+
+
+def test_encode_decode_roundtrip():
+    state = make_state()
+    decoded = decode_session(encode_session(state))
+    assert decoded == state
+    assert decoded.status_name == "awaiting_input"
+    assert decoded.history_dicts() == [
+        {"role": "user", "content": "我头痛"},
+        {"role": "assistant", "content": "发烧几天了？"},
+    ]
+
+
+def test_decode_rejects_other_codec_version(monkeypatch):
+    raw = encode_session(make_state())
+    monkeypatch.setattr(session_state, "CODEC_VERSION", session_state.CODEC_VERSION + 1)
+    with pytest.raises(ValueError):
+        decode_session(raw)
+
+
+def test_response_roundtrip():
+    state = make_state()
+    assert SessionState.from_response(state.to_response()) == state
+
+
+def test_public_json_matches_response_model():
+    state = make_state()
+    expected = state.to_response().model_dump()
+    assert json.loads(encode_response(state)) == expected
+    assert json.loads(transcode_response(encode_session(state))) == expected